@@ -8,6 +8,7 @@ setup(
         'beautifulsoup4',
         'selenium',
         'pandas',
+        'numpy',
         'webdriver-manager',
         'ratelimit'
     ]
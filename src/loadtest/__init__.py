@@ -0,0 +1,8 @@
+"""Load-testing tools: a local sofifa stand-in and a scraper throughput harness."""
+
+from src.loadtest.sofifa_stub import SofifaStub, StubConfig
+
+__all__ = [
+    'SofifaStub',
+    'StubConfig'
+]
@@ -0,0 +1,233 @@
+"""
+End-to-end load test of scrape_league against the local sofifa stand-in.
+
+Runs every combination of fetch backend and concurrency level, each worker
+scraping whole leagues with its own driver, and reports pages/sec, rows/sec,
+page-fetch latency percentiles and memory. Peak RSS is process-wide and
+monotonic; --trace-memory adds a per-scenario tracemalloc peak at the cost
+of several times slower parsing.
+
+    python src/loadtest/harness.py --backends http --concurrency 1 4 8 --leagues 8
+    python src/loadtest/harness.py --latency 0.2 --jitter 0.1 --error-rate 0.02 --throttle-rate 0.05
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+import argparse
+import logging
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import pandas as pd
+
+from main import scrape_league, setup_chrome_options
+from config.leagues import leagues
+from scrapers.http_driver import HttpDriver
+from scrapers.player_scraper import parse_page, scrape_page
+from loadtest.sofifa_stub import SofifaStub, StubConfig
+
+logger = logging.getLogger(__name__)
+
+
+class TimedDriver:
+    """Wraps a driver and records the wall time of every get()."""
+    def __init__(self, driver, latencies: List[float]):
+        self._driver = driver
+        self._latencies = latencies
+
+    def get(self, url: str) -> None:
+        start = time.perf_counter()
+        self._driver.get(url)
+        self._latencies.append(time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def http_driver():
+    return HttpDriver()
+
+
+def selenium_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    options = setup_chrome_options()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+
+BACKENDS: Dict[str, Callable] = {
+    'http': http_driver,
+    'selenium': selenium_driver
+}
+
+
+@dataclass
+class LoadResult:
+    backend: str
+    concurrency: int
+    leagues: int
+    pages: int
+    rows: int
+    expected_rows: int
+    elapsed: float
+    pages_per_sec: float
+    rows_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    peak_rss_mb: Optional[float]
+    traced_peak_mb: Optional[float]
+    http_statuses: str
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[rank]
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1_000_000, 2)
+
+
+def run_scenario(stub: SofifaStub, backend: str, concurrency: int, league_ids: List[int],
+                 year: int = 2024, version_code: str = '240050',
+                 throttled: bool = False, trace_memory: bool = False) -> LoadResult:
+    """Scrape `league_ids` with `concurrency` workers, one driver per worker."""
+    make_driver = BACKENDS[backend]
+    parser = scrape_page if throttled else parse_page
+    latencies: List[float] = []
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def worker(league_id: int) -> int:
+        if not hasattr(local, 'driver'):
+            local.driver = TimedDriver(make_driver(), latencies)
+            with drivers_lock:
+                drivers.append(local.driver)
+        data = scrape_league(local.driver, league_id, year, version_code,
+                             base_url=stub.url, page_wait=0, page_parser=parser)
+        return len(data)
+
+    before = dict(stub.stats.by_status)
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            rows = sum(pool.map(worker, league_ids))
+    finally:
+        elapsed = time.perf_counter() - start
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        for driver in drivers:
+            driver.quit()
+
+    statuses = {
+        status: count - before.get(status, 0)
+        for status, count in stub.stats.by_status.items()
+        if count - before.get(status, 0)
+    }
+    return LoadResult(
+        backend=backend,
+        concurrency=concurrency,
+        leagues=len(league_ids),
+        pages=len(latencies),
+        rows=rows,
+        expected_rows=len(league_ids) * stub.config.players_per_league,
+        elapsed=round(elapsed, 3),
+        pages_per_sec=round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        rows_per_sec=round(rows / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(_percentile(latencies, 50) * 1000, 1),
+        p95_ms=round(_percentile(latencies, 95) * 1000, 1),
+        p99_ms=round(_percentile(latencies, 99) * 1000, 1),
+        max_ms=round(max(latencies, default=0) * 1000, 1),
+        peak_rss_mb=_peak_rss_mb(),
+        traced_peak_mb=round(peak / 1_000_000, 2) if peak is not None else None,
+        http_statuses=', '.join(f"{s}:{c}" for s, c in sorted(statuses.items()))
+    )
+
+
+def run_load_test(config: StubConfig, backends: List[str], concurrency_levels: List[int],
+                  league_count: int, throttled: bool = False,
+                  trace_memory: bool = False) -> pd.DataFrame:
+    """Run every backend x concurrency combination against one stand-in server."""
+    league_ids = list(leagues.keys())[:league_count]
+    results = []
+    with SofifaStub(config) as stub:
+        for backend in backends:
+            for concurrency in concurrency_levels:
+                logger.info(f"Running {backend} backend with concurrency {concurrency}")
+                results.append(run_scenario(stub, backend, concurrency, league_ids,
+                                            throttled=throttled, trace_memory=trace_memory))
+    return pd.DataFrame([asdict(r) for r in results])
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backends', nargs='+', default=['http'], choices=sorted(BACKENDS))
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 2, 4, 8])
+    parser.add_argument('--leagues', type=int, default=8, help='number of leagues to scrape per scenario')
+    parser.add_argument('--players', type=int, default=300, help='players per league on the stand-in')
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--jitter', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--throttled', action='store_true',
+                        help='keep the 30 pages/minute scrape_page rate limit')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='measure per-scenario peak allocations with tracemalloc (slow)')
+    parser.add_argument('--output', help='write results to this CSV file')
+    parser.add_argument('--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> pd.DataFrame:
+    args = parse_args(argv)
+    logging.basicConfig(format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+    logger.setLevel(logging.INFO)
+
+    config = StubConfig(
+        players_per_league=args.players,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate
+    )
+    results = run_load_test(config, args.backends, args.concurrency, args.leagues,
+                            args.throttled, args.trace_memory)
+    print(results.to_string(index=False))
+    if args.output:
+        results.to_csv(args.output, index=False)
+        logger.info(f"Results saved to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
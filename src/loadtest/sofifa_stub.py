@@ -0,0 +1,238 @@
+"""
+Local HTTP stand-in for the sofifa.com players table.
+
+Serves /players pages rendered from templates with the same markup the
+scraper parses (player link with data-tippy-content, span.pos, div.sub
+contract cell, td[data-col] attributes) plus a "Next" link while more rows
+remain. Every lg / r / offset combination is valid and deterministic.
+Latency, jitter, 5xx errors and 429 throttling can be injected.
+"""
+
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head><title>Players - SoFIFA stand-in</title></head>
+<body>
+<table>
+<thead><tr><th>Name</th><th>Stats</th></tr></thead>
+<tbody>
+$rows
+</tbody>
+</table>
+<div class="pagination">$pagination</div>
+</body>
+</html>""")
+
+ROW_TEMPLATE = Template("""<tr>
+<td><a href="/player/$player_id/$slug/$version/" data-tippy-content="$name">$name</a>
+$positions</td>
+<td><div class="sub">$contract</div></td>
+$cells
+</tr>""")
+
+ERROR_PAGE = "<html><body><h1>$status</h1><p>$reason</p></body></html>"
+
+FIRST_NAMES = ['Luca', 'Mateo', 'Noah', 'Kai', 'Jonas', 'Rafael', 'Theo', 'Ivan', 'Omar', 'Leo']
+LAST_NAMES = ['Silva', 'Müller', 'García', 'Rossi', 'Novak', 'Jensen', 'Okafor', 'Kim', 'Dubois', 'Costa']
+POSITIONS = ['GK', 'CB', 'LB', 'RB', 'LWB', 'RWB', 'CDM', 'CM', 'CAM', 'LM', 'RM', 'LW', 'RW', 'CF', 'ST']
+
+# data-col codes requested by scrape_league, grouped by how their values look
+RATING_CODES = [
+    'oa', 'pt', 'bo', 'cr', 'fi', 'he', 'sh', 'vo', 'dr', 'cu', 'fr', 'lo', 'bl',
+    'ac', 'sp', 'ag', 're', 'ba', 'so', 'ju', 'st', 'sr', 'ln', 'ar', 'in', 'po',
+    'vi', 'pe', 'cm', 'ma', 'sa', 'sl', 'gd', 'gh', 'gc', 'gp', 'gr',
+    'pac', 'sho', 'pas', 'dri', 'def', 'phy'
+]
+TOTAL_CODES = ['ta', 'ts', 'to', 'tp', 'te', 'td', 'tg', 'tt', 'bs']
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stand-in server."""
+    players_per_league: int = 300
+    page_size: int = 60
+    latency: float = 0.05        # seconds added to every response
+    jitter: float = 0.02         # +/- uniform noise on latency
+    error_rate: float = 0.0      # share of responses answered with 503
+    throttle_rate: float = 0.0   # share of responses answered with 429
+    seed: int = 0
+
+
+@dataclass
+class StubStats:
+    """Request counters, safe to read while the server runs."""
+    requests: int = 0
+    by_status: Dict[int, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, status: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.by_status[status] = self.by_status.get(status, 0) + 1
+
+
+def _money(rng: random.Random, low: float, high: float) -> str:
+    value = rng.uniform(low, high)
+    if value >= 1_000_000:
+        return f"€{value / 1_000_000:.1f}M"
+    if value >= 1_000:
+        return f"€{value / 1_000:.0f}K"
+    return f"€{value:,.0f}"
+
+
+def render_row(lg: int, version: str, index: int) -> str:
+    """One deterministic player row for league `lg`, roster `version`."""
+    rng = random.Random(f"{lg}-{version}-{index}")
+    player_id = 100_000 + lg * 10_000 + index
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    positions = rng.sample(POSITIONS, rng.randint(1, 3))
+    start = rng.randint(2015, 2024)
+
+    cells = {code: str(rng.randint(25, 95)) for code in RATING_CODES}
+    cells.update({code: str(rng.randint(150, 2300)) for code in TOTAL_CODES})
+    cells.update({
+        'pi': str(player_id),
+        'ae': str(rng.randint(16, 40)),
+        'hi': f"{rng.randint(165, 200)}cm",
+        'wi': f"{rng.randint(60, 95)}kg",
+        'pf': rng.choice(['Left', 'Right']),
+        'bp': positions[0],
+        'gu': str(rng.randint(0, 20)),
+        'jt': f"Jul {rng.randint(1, 28)}, {start}",
+        'le': 'N/A',
+        'vl': _money(rng, 50_000, 120_000_000),
+        'wg': _money(rng, 500, 400_000),
+        'rc': _money(rng, 100_000, 200_000_000),
+        'wk': str(rng.randint(1, 5)),
+        'sk': str(rng.randint(1, 5)),
+        'aw': rng.choice(['Low', 'Medium', 'High']),
+        'dw': rng.choice(['Low', 'Medium', 'High']),
+        'ir': str(rng.randint(1, 5)),
+        'bt': 'Normal (170-185)',
+        'hc': rng.choice(['Yes', 'No'])
+    })
+
+    return ROW_TEMPLATE.substitute(
+        player_id=player_id,
+        slug=name.lower().replace(' ', '-'),
+        version=version,
+        name=name,
+        positions=''.join(f'<span class="pos">{pos}</span>' for pos in positions),
+        contract=f"{start} ~ {start + rng.randint(1, 5)}",
+        cells='\n'.join(f'<td data-col="{code}">{value}</td>' for code, value in cells.items())
+    )
+
+
+def render_page(config: StubConfig, query: Dict[str, list]) -> str:
+    """Players page for the lg / r / offset in `query`."""
+    lg = int(query.get('lg', ['0'])[0])
+    version = query.get('r', ['0'])[0]
+    offset = int(query.get('offset', ['0'])[0])
+
+    end = min(offset + config.page_size, config.players_per_league)
+    rows = '\n'.join(render_row(lg, version, i) for i in range(offset, end))
+
+    pagination = ''
+    if end < config.players_per_league:
+        next_query = dict(query)
+        next_query['offset'] = [str(end)]
+        pagination = f'<a class="button" href="/players?{urlencode(next_query, doseq=True)}">Next</a>'
+    return PAGE_TEMPLATE.substitute(rows=rows, pagination=pagination)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: 'SofifaStub'
+
+    def do_GET(self):
+        stub = self.server
+        config = stub.config
+        delay = config.latency + stub.rng_uniform(-config.jitter, config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        url = urlparse(self.path)
+        roll = stub.rng_uniform(0, 1)
+        if url.path != '/players':
+            self._send(404, 'Not Found')
+        elif roll < config.throttle_rate:
+            self._send(429, 'Too Many Requests', {'Retry-After': '1'})
+        elif roll < config.throttle_rate + config.error_rate:
+            self._send(503, 'Service Unavailable')
+        else:
+            body = render_page(config, parse_qs(url.query)).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            stub.stats.record(200)
+
+    def _send(self, status: int, reason: str, headers: Optional[Dict[str, str]] = None):
+        body = Template(ERROR_PAGE).substitute(status=status, reason=reason).encode('utf-8')
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.stats.record(status)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class SofifaStub(ThreadingHTTPServer):
+    """
+    Threaded stand-in server. Use as a context manager:
+
+        with SofifaStub(StubConfig(latency=0.1)) as stub:
+            scrape_league(driver, 39, 2024, '240050', base_url=stub.url)
+    """
+    daemon_threads = True
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.config = config or StubConfig()
+        self.stats = StubStats()
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rng_uniform(self, low: float, high: float) -> float:
+        with self._rng_lock:
+            return self._rng.uniform(low, high)
+
+    def start(self) -> 'SofifaStub':
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"SoFIFA stand-in listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'SofifaStub':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -13,10 +13,11 @@ from selenium.webdriver.chrome.options import Options
 import logging
 from datetime import datetime
 import json
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 
 from scrapers.player_scraper import scrape_page
 from config.leagues import leagues
+from utils.deltas import update_delta_tables
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +26,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SOFIFA_URL = "https://sofifa.com"
+
 def get_fifa_versions(driver: webdriver.Chrome) -> Dict[int, str]:
     """
     Get all available FIFA version codes from the roster dropdown.
@@ -32,7 +35,7 @@ def get_fifa_versions(driver: webdriver.Chrome) -> Dict[int, str]:
     """
     try:
         # Go to the main page first
-        driver.get("https://sofifa.com")
+        driver.get(SOFIFA_URL)
         time.sleep(5)  # Wait for page to load
 
         # Click on any dropdown/button if needed to show roster versions
@@ -150,8 +153,14 @@ def has_next_page(driver) -> bool:
         logger.warning(f"Error checking for next page: {e}")
         return False
 
-def scrape_league(driver: webdriver.Chrome, league_id: int, year: int, version_code: str) -> List[Dict]:
-    """Scrape all player data for a single league and year."""
+def scrape_league(driver: webdriver.Chrome, league_id: int, year: int, version_code: str,
+                  base_url: str = SOFIFA_URL, page_wait: float = 2,
+                  page_parser: Callable = scrape_page) -> List[Dict]:
+    """
+    Scrape all player data for a single league and year.
+    `base_url`, `page_wait` and `page_parser` let the load-test harness point
+    the scraper at a local stand-in without the fixed delays and rate limit.
+    """
     league_data = []
     offset = 0
     league_name = leagues[league_id]['name']
@@ -160,8 +169,8 @@ def scrape_league(driver: webdriver.Chrome, league_id: int, year: int, version_c
     
     while True:
         try:
-            base_url = (
-                f"https://sofifa.com/players?r={version_code}&set=true"
+            page_url = (
+                f"{base_url}/players?r={version_code}&set=true"
                 "&type=all"
                 "&showCol[]=pi&showCol[]=ae&showCol[]=hi&showCol[]=wi&showCol[]=pf"
                 "&showCol[]=oa&showCol[]=pt&showCol[]=bo&showCol[]=bp&showCol[]=gu"
@@ -185,12 +194,12 @@ def scrape_league(driver: webdriver.Chrome, league_id: int, year: int, version_c
             
             logger.info(f"Scraping {league_name} - FIFA {year} - Page {offset//60 + 1}")
             
-            driver.get(base_url)
+            driver.get(page_url)
             driver.execute_script("window.stop();")
-            time.sleep(2)  # Wait for content to load
+            time.sleep(page_wait)  # Wait for content to load
             
             soup = BeautifulSoup(driver.page_source, 'html.parser')
-            page_data = scrape_page(soup, league_id)
+            page_data = page_parser(soup, league_id)
             
             if not page_data:
                 logger.warning(f"No data found on page {offset//60 + 1}")
@@ -261,6 +270,9 @@ def main():
                     continue
                     
             logger.info(f"Completed processing {league_name}")
+        
+        # Refresh cross-season delta tables for any newly scraped versions
+        update_delta_tables(years=sorted(hardcoded_versions.keys()))
             
     except Exception as e:
         logger.error(f"Fatal error in main execution: {e}")
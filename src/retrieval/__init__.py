@@ -0,0 +1,17 @@
+"""Retrieval over the persisted Player Finder vector index."""
+
+from src.retrieval.cache import LRUCache, QueryCache
+from src.retrieval.lazy_docstore import LazyDocstore, convert_json_docstore
+from src.retrieval.lexical import BM25Index
+from src.retrieval.retriever import PersistedIndex, PlayerFinderRetriever, RetrievedNode
+
+__all__ = [
+    'BM25Index',
+    'LazyDocstore',
+    'convert_json_docstore',
+    'LRUCache',
+    'QueryCache',
+    'PersistedIndex',
+    'PlayerFinderRetriever',
+    'RetrievedNode'
+]
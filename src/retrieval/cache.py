@@ -0,0 +1,135 @@
+"""
+Caches for the Player Finder retrieval path.
+
+Chat users repeat the same kinds of questions, so retrieval keeps two caches:
+query text -> embedding, and (query, filters, index version) -> top-k
+results. Entries remember how long they took to compute, which lets the
+stats report the latency a hit saved.
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import re
+import threading
+import time
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive cache key for a query."""
+    return re.sub(r'\s+', ' ', query).strip().lower().rstrip('?!.')
+
+
+def freeze_filters(filters: Optional[Dict[str, Any]]) -> Tuple:
+    """Hashable, order-independent form of a metadata filter dict."""
+    if not filters:
+        return ()
+    return tuple(sorted(
+        (key, tuple(sorted(map(str, value))) if isinstance(value, (list, tuple, set)) else str(value))
+        for key, value in filters.items()
+    ))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {**asdict(self), 'hit_rate': round(self.hit_rate, 4)}
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with an optional per-entry time to live.
+    Each entry stores (value, created_at, compute_seconds).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[1] > self.ttl:
+                del self._entries[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            self.stats.saved_seconds += entry[2]
+            return True, entry[0]
+
+    def put(self, key: Hashable, value: Any, compute_seconds: float = 0.0) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic(), compute_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        found, value = self.get(key)
+        if found:
+            return value
+        start = time.perf_counter()
+        value = compute()
+        self.put(key, value, time.perf_counter() - start)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._entries:
+                self.stats.invalidations += 1
+            self._entries.clear()
+
+
+class QueryCache:
+    """
+    Embedding cache keyed by normalized query text plus a result cache keyed
+    by (normalized query, filters, k, index version). Results computed against
+    an older index version are dropped as soon as a new version is seen.
+    """
+
+    def __init__(self, embedding_maxsize: int = 4096, result_maxsize: int = 1024,
+                 embedding_ttl: Optional[float] = None, result_ttl: Optional[float] = 3600):
+        self.embeddings = LRUCache(embedding_maxsize, embedding_ttl)
+        self.results = LRUCache(result_maxsize, result_ttl)
+        self._index_version: Optional[str] = None
+
+    def sync_index_version(self, version: str) -> None:
+        """Invalidate cached results if the index or docstore changed."""
+        if self._index_version is not None and version != self._index_version:
+            self.results.clear()
+        self._index_version = version
+
+    def embedding(self, query: str, embed: Callable[[str], Any]) -> Any:
+        return self.embeddings.get_or_compute(normalize_query(query), lambda: embed(query))
+
+    def result_key(self, query: str, filters: Optional[Dict[str, Any]], k: int) -> Tuple:
+        return (normalize_query(query), freeze_filters(filters), k, self._index_version)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            'embeddings': self.embeddings.stats.to_dict(),
+            'results': self.results.stats.to_dict()
+        }
@@ -0,0 +1,28 @@
+"""
+Convert a persisted docstore.json to the offset-indexed LazyDocstore layout.
+
+    python src/retrieval/convert_docstore.py dataset_vector_embedding
+"""
+
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from typing import List, Optional
+import argparse
+import logging
+
+from src.retrieval.lazy_docstore import convert_json_docstore
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Convert docstore.json to the offset-indexed layout.')
+    parser.add_argument('persist_dir', nargs='?', default='dataset_vector_embedding')
+    parser.add_argument('--level', type=int, default=6, help='zlib compression level')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    convert_json_docstore(args.persist_dir, args.level)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Read access to the docstore persisted next to the Player Finder vector index.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import json
+import logging
+
+from src.retrieval.lexical import node_content_hash
+
+logger = logging.getLogger(__name__)
+
+DOCSTORE_FILE = 'docstore.json'
+
+
+class JsonDocstore:
+    """
+    The LlamaIndex `docstore.json` layout: one JSON object holding
+    docstore/data (node id -> serialized node), docstore/metadata
+    (ref doc id -> doc_hash) and docstore/ref_doc_info.
+    """
+
+    def __init__(self, data: Dict):
+        self._nodes: Dict[str, Dict] = data.get('docstore/data', {})
+        self._metadata: Dict[str, Dict] = data.get('docstore/metadata', {})
+
+    @classmethod
+    def load(cls, persist_dir: str) -> 'JsonDocstore':
+        path = Path(persist_dir) / DOCSTORE_FILE
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        logger.info(f"Loaded {len(data.get('docstore/data', {}))} nodes from {path}")
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._nodes
+
+    def node_ids(self) -> List[str]:
+        return list(self._nodes)
+
+    def get(self, node_id: str) -> Optional[Dict]:
+        """The node's `__data__` payload (id_, text, metadata, relationships, ...)."""
+        node = self._nodes.get(node_id)
+        return node['__data__'] if node is not None else None
+
+    def iter_nodes(self) -> Iterator[Dict]:
+        for node in self._nodes.values():
+            yield node['__data__']
+
+    def node_hashes(self) -> Dict[str, str]:
+        """Node id -> hash of its text and metadata, for incremental index updates."""
+        return {
+            node['id_']: node_content_hash(node.get('text', ''), node.get('metadata', {}))
+            for node in self.iter_nodes()
+        }
+
+    def doc_hashes(self) -> Dict[str, str]:
+        """Ref doc id -> doc_hash, used to tell when the indexed documents change."""
+        return {doc_id: meta.get('doc_hash', '') for doc_id, meta in self._metadata.items()}
@@ -0,0 +1,230 @@
+"""
+Offset-indexed docstore that opens without parsing every node.
+
+`docstore.json` is a single JSON blob with every node's text, metadata and
+relationships, so loading the index parses all of it even when a query
+needs only the top-k nodes. This layout splits it into:
+
+    docstore.records     zlib-compressed JSON, one record per node
+    docstore.offsets     sorted fixed-width table: node id -> offset, length, content hash
+    docstore.meta.json   doc_hash metadata and the source file signature
+    docstore.refdocs     zlib-compressed ref_doc_info, read only on request
+
+Both binary files are memory-mapped. Opening reads only the small header;
+get() binary-searches the offset table and decompresses a single record.
+
+    python src/retrieval/convert_docstore.py dataset_vector_embedding
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+
+from src.retrieval.docstore import DOCSTORE_FILE, JsonDocstore
+from src.retrieval.lexical import node_content_hash
+
+logger = logging.getLogger(__name__)
+
+RECORDS_FILE = 'docstore.records'
+OFFSETS_FILE = 'docstore.offsets'
+META_FILE = 'docstore.meta.json'
+REF_DOCS_FILE = 'docstore.refdocs'
+LAZY_FILES = [RECORDS_FILE, OFFSETS_FILE, META_FILE, REF_DOCS_FILE]
+
+MAGIC = b'PFDS'
+FORMAT_VERSION = 1
+KEY_WIDTH = 64
+# magic, format version, key width, entry count
+_HEADER = struct.Struct('<4sHHQ')
+# node id (NUL padded), record offset, record length, sha1 of text + metadata
+_ENTRY = struct.Struct(f'<{KEY_WIDTH}sQI20s')
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _encode_key(node_id: str) -> bytes:
+    key = node_id.encode('utf-8')
+    if len(key) > KEY_WIDTH:
+        raise ValueError(f"Node id longer than {KEY_WIDTH} bytes: {node_id}")
+    return key.ljust(KEY_WIDTH, b'\0')
+
+
+def convert_json_docstore(persist_dir: str, compress_level: int = 6) -> int:
+    """
+    Write the offset-indexed layout from `docstore.json` in `persist_dir`.
+    Files are written to temporaries and swapped in. Returns the node count.
+    """
+    persist = Path(persist_dir)
+    source = persist / DOCSTORE_FILE
+    with open(source, encoding='utf-8') as f:
+        data = json.load(f)
+    nodes: Dict[str, Dict] = data.get('docstore/data', {})
+
+    entries: List[Tuple[bytes, int, int, bytes]] = []
+    records_tmp = persist / (RECORDS_FILE + '.tmp')
+    with open(records_tmp, 'wb') as records:
+        offset = 0
+        for node_id, node in nodes.items():
+            payload = node.get('__data__', {})
+            record = zlib.compress(
+                json.dumps(node, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+                compress_level
+            )
+            records.write(record)
+            content_hash = node_content_hash(payload.get('text', ''), payload.get('metadata', {}))
+            entries.append((_encode_key(node_id), offset, len(record), bytes.fromhex(content_hash)))
+            offset += len(record)
+
+    entries.sort(key=lambda entry: entry[0])
+    offsets_tmp = persist / (OFFSETS_FILE + '.tmp')
+    with open(offsets_tmp, 'wb') as offsets:
+        offsets.write(_HEADER.pack(MAGIC, FORMAT_VERSION, KEY_WIDTH, len(entries)))
+        for entry in entries:
+            offsets.write(_ENTRY.pack(*entry))
+
+    meta_tmp = persist / (META_FILE + '.tmp')
+    with open(meta_tmp, 'w', encoding='utf-8') as f:
+        json.dump({
+            'format_version': FORMAT_VERSION,
+            'source_signature': _file_signature(source),
+            'docstore/metadata': data.get('docstore/metadata', {})
+        }, f, ensure_ascii=False)
+
+    ref_docs_tmp = persist / (REF_DOCS_FILE + '.tmp')
+    ref_doc_info = json.dumps(data.get('docstore/ref_doc_info', {}), ensure_ascii=False)
+    ref_docs_tmp.write_bytes(zlib.compress(ref_doc_info.encode('utf-8'), compress_level))
+
+    os.replace(records_tmp, persist / RECORDS_FILE)
+    os.replace(offsets_tmp, persist / OFFSETS_FILE)
+    os.replace(meta_tmp, persist / META_FILE)
+    os.replace(ref_docs_tmp, persist / REF_DOCS_FILE)
+    logger.info(f"Converted {len(entries)} nodes from {source} ({source.stat().st_size} bytes) "
+                f"to {(persist / RECORDS_FILE).stat().st_size} bytes of compressed records")
+    return len(entries)
+
+
+class LazyDocstore:
+    """Read-only docstore over memory-mapped offset and record files."""
+
+    def __init__(self, persist_dir: str):
+        persist = Path(persist_dir)
+        self._ref_docs_path = persist / REF_DOCS_FILE
+        with open(persist / META_FILE, encoding='utf-8') as f:
+            self._meta = json.load(f)
+        self._offsets_file = open(persist / OFFSETS_FILE, 'rb')
+        self._records_file = open(persist / RECORDS_FILE, 'rb')
+        self._offsets = mmap.mmap(self._offsets_file.fileno(), 0, access=mmap.ACCESS_READ)
+        records_size = os.fstat(self._records_file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._records = (mmap.mmap(self._records_file.fileno(), 0, access=mmap.ACCESS_READ)
+                         if records_size else b'')
+
+        magic, version, key_width, count = _HEADER.unpack_from(self._offsets, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or key_width != KEY_WIDTH:
+            raise ValueError(f"{persist / OFFSETS_FILE} is not a supported offset index")
+        self._count = count
+
+    @classmethod
+    def load(cls, persist_dir: str) -> 'LazyDocstore':
+        return cls(persist_dir)
+
+    def close(self) -> None:
+        self._offsets.close()
+        if isinstance(self._records, mmap.mmap):
+            self._records.close()
+        self._offsets_file.close()
+        self._records_file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, i: int) -> Tuple[bytes, int, int, bytes]:
+        return _ENTRY.unpack_from(self._offsets, _HEADER.size + i * _ENTRY.size)
+
+    def _find(self, node_id: str) -> Optional[Tuple[bytes, int, int, bytes]]:
+        try:
+            key = _encode_key(node_id)
+        except ValueError:
+            return None
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._entry(mid)
+            if entry[0] < key:
+                lo = mid + 1
+            elif entry[0] > key:
+                hi = mid
+            else:
+                return entry
+        return None
+
+    def __contains__(self, node_id: str) -> bool:
+        return self._find(node_id) is not None
+
+    def node_ids(self) -> List[str]:
+        return [self._entry(i)[0].rstrip(b'\0').decode('utf-8') for i in range(self._count)]
+
+    def _read(self, offset: int, length: int) -> Dict:
+        return json.loads(zlib.decompress(self._records[offset:offset + length]))
+
+    def get(self, node_id: str) -> Optional[Dict]:
+        """The node's `__data__` payload, decompressed from its record only."""
+        entry = self._find(node_id)
+        if entry is None:
+            return None
+        return self._read(entry[1], entry[2])['__data__']
+
+    def iter_nodes(self) -> Iterator[Dict]:
+        for i in range(self._count):
+            _, offset, length, _ = self._entry(i)
+            yield self._read(offset, length)['__data__']
+
+    def node_hashes(self) -> Dict[str, str]:
+        """Content hashes straight from the offset table; no records are read."""
+        hashes = {}
+        for i in range(self._count):
+            key, _, _, content_hash = self._entry(i)
+            hashes[key.rstrip(b'\0').decode('utf-8')] = content_hash.hex()
+        return hashes
+
+    def doc_hashes(self) -> Dict[str, str]:
+        return {
+            doc_id: meta.get('doc_hash', '')
+            for doc_id, meta in self._meta.get('docstore/metadata', {}).items()
+        }
+
+    def ref_doc_info(self) -> Dict[str, Dict]:
+        """Ref doc id -> node ids and metadata; decompressed on each call."""
+        return json.loads(zlib.decompress(self._ref_docs_path.read_bytes()))
+
+    def is_current(self, persist_dir: str) -> bool:
+        """False if docstore.json changed after this layout was converted from it."""
+        source = _file_signature(Path(persist_dir) / DOCSTORE_FILE)
+        return source is None or source == self._meta.get('source_signature')
+
+
+def load_docstore(persist_dir: str):
+    """
+    LazyDocstore if the offset-indexed layout exists, re-converting it when
+    docstore.json has changed since; otherwise the plain JsonDocstore.
+    """
+    persist = Path(persist_dir)
+    if not all((persist / name).exists() for name in LAZY_FILES):
+        return JsonDocstore.load(persist_dir)
+    docstore = LazyDocstore.load(persist_dir)
+    if not docstore.is_current(persist_dir):
+        logger.info(f"{DOCSTORE_FILE} changed since conversion, rebuilding offset index")
+        docstore.close()
+        convert_json_docstore(persist_dir)
+        docstore = LazyDocstore.load(persist_dir)
+    return docstore
@@ -0,0 +1,235 @@
+"""
+BM25 inverted index over docstore nodes.
+
+Player questions often name exact entities (a player, club, league or a
+position such as "LWB") that embeddings can miss. The index scores node text
+plus selected metadata fields with BM25, and keeps per-field value postings
+so metadata filters resolve to a candidate set without touching vectors.
+It is persisted next to the vector store and updated incrementally: only
+nodes whose content hash changed are re-tokenized.
+"""
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+import json
+import logging
+import math
+import re
+
+logger = logging.getLogger(__name__)
+
+LEXICAL_INDEX_FILE = 'bm25_index.json'
+FORMAT_VERSION = 1
+
+METADATA_FIELDS = ['league', 'year', 'position', 'club', 'player', 'file_name', 'page_label']
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'best', 'by', 'for', 'from', 'in',
+    'is', 'it', 'me', 'of', 'on', 'or', 'show', 'the', 'to', 'who', 'with'
+}
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens; short tokens are kept so positions like "st" survive."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def node_content_hash(text: str, metadata: Dict[str, Any]) -> str:
+    payload = json.dumps([text, metadata], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def field_value(value: Any) -> str:
+    """Normalized metadata value used for filter matching."""
+    return str(value).strip().lower()
+
+
+class BM25Index:
+    """Okapi BM25 over node text and metadata, with metadata value postings."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75,
+                 metadata_fields: Optional[List[str]] = None):
+        self.k1 = k1
+        self.b = b
+        self.metadata_fields = list(metadata_fields or METADATA_FIELDS)
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_len: Dict[str, int] = {}
+        self.doc_hash: Dict[str, str] = {}
+        self.field_values: Dict[str, Dict[str, Set[str]]] = {}
+        self._doc_fields: Dict[str, Dict[str, str]] = {}
+        self._doc_terms: Dict[str, List[str]] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_len)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.doc_len
+
+    @property
+    def avg_len(self) -> float:
+        return self._total_len / len(self.doc_len) if self.doc_len else 0.0
+
+    def add(self, node_id: str, text: str, metadata: Dict[str, Any],
+            content_hash: Optional[str] = None) -> None:
+        if node_id in self.doc_len:
+            self.remove(node_id)
+
+        fields = {
+            key: field_value(metadata[key])
+            for key in self.metadata_fields
+            if metadata.get(key) not in (None, '')
+        }
+        tokens = tokenize(text)
+        for value in fields.values():
+            tokens.extend(tokenize(value))
+
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[node_id] = tf
+        self._doc_terms[node_id] = list(counts)
+        for key, value in fields.items():
+            self.field_values.setdefault(key, {}).setdefault(value, set()).add(node_id)
+
+        self.doc_len[node_id] = len(tokens)
+        self.doc_hash[node_id] = content_hash or node_content_hash(text, metadata)
+        self._doc_fields[node_id] = fields
+        self._total_len += len(tokens)
+
+    def remove(self, node_id: str) -> None:
+        if node_id not in self.doc_len:
+            return
+        for term in self._doc_terms.pop(node_id, []):
+            docs = self.postings.get(term, {})
+            if docs.pop(node_id, None) is not None and not docs:
+                del self.postings[term]
+        for key, value in self._doc_fields.pop(node_id, {}).items():
+            ids = self.field_values.get(key, {}).get(value)
+            if ids is not None:
+                ids.discard(node_id)
+                if not ids:
+                    del self.field_values[key][value]
+        self._total_len -= self.doc_len.pop(node_id)
+        self.doc_hash.pop(node_id, None)
+
+    def update(self, node_hashes: Dict[str, str], fetch) -> Tuple[int, int]:
+        """
+        Bring the index in line with a docstore. `node_hashes` maps every
+        current node id to its content hash; `fetch(node_id)` returns the
+        node's data dict and is only called for new or changed nodes.
+        Returns (added_or_changed, removed).
+        """
+        removed = [node_id for node_id in self.doc_len if node_id not in node_hashes]
+        for node_id in removed:
+            self.remove(node_id)
+
+        changed = 0
+        for node_id, content_hash in node_hashes.items():
+            if self.doc_hash.get(node_id) == content_hash:
+                continue
+            data = fetch(node_id) or {}
+            self.add(node_id, data.get('text', ''), data.get('metadata', {}), content_hash)
+            changed += 1
+        return changed, len(removed)
+
+    def filter(self, filters: Dict[str, Any]) -> Set[str]:
+        """
+        Node ids whose metadata field equals (or is one of) each filter value.
+        Raises ValueError for a key outside `metadata_fields`, which has no
+        postings and would otherwise silently match nothing; callers filter
+        on other keys themselves (see PersistedIndex.filtered_node_ids).
+        """
+        unknown = [key for key in filters if key not in self.metadata_fields]
+        if unknown:
+            raise ValueError(f"Cannot filter on {unknown}: the lexical index covers {self.metadata_fields}")
+        result: Optional[Set[str]] = None
+        for key, expected in filters.items():
+            values = expected if isinstance(expected, (list, tuple, set)) else [expected]
+            index = self.field_values.get(key, {})
+            ids: Set[str] = set()
+            for value in values:
+                ids |= index.get(field_value(value), set())
+            result = ids if result is None else result & ids
+        return result if result is not None else set(self.doc_len)
+
+    def search(self, query: str, k: int = 10,
+               candidates: Optional[Iterable[str]] = None) -> List[Tuple[str, float]]:
+        """Top-k (node_id, BM25 score), optionally restricted to `candidates`."""
+        allowed = set(candidates) if candidates is not None else None
+        n_docs = len(self.doc_len)
+        avg_len = self.avg_len or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for node_id, tf in docs.items():
+                if allowed is not None and node_id not in allowed:
+                    continue
+                norm = tf + self.k1 * (1 - self.b + self.b * self.doc_len[node_id] / avg_len)
+                scores[node_id] = scores.get(node_id, 0.0) + idf * tf * (self.k1 + 1) / norm
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+
+    def save(self, persist_dir: str) -> None:
+        path = Path(persist_dir) / LEXICAL_INDEX_FILE
+        data = {
+            'format_version': FORMAT_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'metadata_fields': self.metadata_fields,
+            'postings': self.postings,
+            'doc_len': self.doc_len,
+            'doc_hash': self.doc_hash,
+            'doc_fields': self._doc_fields
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        logger.info(f"Saved BM25 index with {len(self)} nodes to {path}")
+
+    @classmethod
+    def load(cls, persist_dir: str) -> Optional['BM25Index']:
+        path = Path(persist_dir) / LEXICAL_INDEX_FILE
+        if not path.exists():
+            return None
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format_version') != FORMAT_VERSION:
+            logger.warning(f"Ignoring {path}: unsupported format version")
+            return None
+        index = cls(data['k1'], data['b'], data['metadata_fields'])
+        index.postings = data['postings']
+        index.doc_len = data['doc_len']
+        index.doc_hash = data['doc_hash']
+        index._doc_fields = data['doc_fields']
+        index._total_len = sum(index.doc_len.values())
+        for term, docs in index.postings.items():
+            for node_id in docs:
+                index._doc_terms.setdefault(node_id, []).append(term)
+        for node_id, fields in index._doc_fields.items():
+            for key, value in fields.items():
+                index.field_values.setdefault(key, {}).setdefault(value, set()).add(node_id)
+        return index
+
+    @classmethod
+    def load_or_build(cls, persist_dir: str, node_hashes: Dict[str, str], fetch) -> 'BM25Index':
+        """Load the persisted index, apply any docstore changes, and save if it changed."""
+        index = cls.load(persist_dir) or cls()
+        changed, removed = index.update(node_hashes, fetch)
+        if changed or removed:
+            logger.info(f"BM25 index: {changed} nodes added/updated, {removed} removed")
+            index.save(persist_dir)
+        return index
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """Fuse ranked id lists; each id scores sum(1 / (k + rank))."""
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, node_id in enumerate(ranking, start=1):
+            scores[node_id] = scores.get(node_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -0,0 +1,244 @@
+"""
+Player Finder retrieval over the persisted `dataset_vector_embedding` store.
+
+The embedding model is supplied by the caller (the store holds 768-d
+vectors; queries must be embedded with the model that built it).
+
+Hybrid mode first resolves metadata filters and BM25 matches from the
+lexical index, vector-scores only those candidates, and fuses the two
+rankings with reciprocal rank fusion. Queries with too few lexical matches
+fall back to vector search over the filtered set.
+"""
+
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import hashlib
+import logging
+
+import numpy as np
+
+from src.retrieval.cache import QueryCache
+from src.retrieval.docstore import DOCSTORE_FILE, JsonDocstore
+from src.retrieval.lazy_docstore import LAZY_FILES, LazyDocstore, load_docstore
+from src.retrieval.lexical import BM25Index, field_value, reciprocal_rank_fusion
+from src.retrieval.vector_store import (
+    INDEX_STORE_FILE,
+    VECTOR_STORE_FILE,
+    FlatVectorStore,
+    load_row_to_node
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERSIST_DIR = 'dataset_vector_embedding'
+STORE_FILES = [DOCSTORE_FILE, INDEX_STORE_FILE, VECTOR_STORE_FILE] + LAZY_FILES
+
+
+@dataclass
+class RetrievedNode:
+    node_id: str
+    text: str
+    distance: Optional[float]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    lexical_score: Optional[float] = None
+    score: Optional[float] = None
+
+
+def store_signature(persist_dir: str) -> Tuple:
+    """(name, size, mtime) of each store file; cheap to poll for on-disk changes."""
+    signature = []
+    for name in STORE_FILES:
+        path = Path(persist_dir) / name
+        stat = path.stat() if path.exists() else None
+        signature.append((name, stat.st_size if stat else None, stat.st_mtime_ns if stat else None))
+    return tuple(signature)
+
+
+class PersistedIndex:
+    """Docstore, vector store, lexical index and row -> node mapping from one directory."""
+
+    def __init__(self, persist_dir: str, docstore: Union[JsonDocstore, LazyDocstore], vectors: FlatVectorStore,
+                 row_to_node: Dict[int, str], lexical: BM25Index):
+        self.persist_dir = persist_dir
+        self.docstore = docstore
+        self.vectors = vectors
+        self.lexical = lexical
+        self.row_to_node = row_to_node
+        self.node_to_row = {node_id: row for row, node_id in row_to_node.items()}
+        self.signature = store_signature(persist_dir)
+        self.version = self._compute_version()
+
+    @classmethod
+    def load(cls, persist_dir: str = DEFAULT_PERSIST_DIR) -> 'PersistedIndex':
+        docstore = load_docstore(persist_dir)
+        return cls(
+            persist_dir,
+            docstore,
+            FlatVectorStore.load(persist_dir),
+            load_row_to_node(persist_dir),
+            BM25Index.load_or_build(persist_dir, docstore.node_hashes(), docstore.get)
+        )
+
+    def _compute_version(self) -> str:
+        """
+        Hash of the docstore doc_hash set, the vector contents and the
+        index_store row -> node map, so re-embedding or remapping rows also
+        yields a new version.
+        """
+        digest = hashlib.sha256()
+        for doc_id, doc_hash in sorted(self.docstore.doc_hashes().items()):
+            digest.update(f"{doc_id}:{doc_hash};".encode('utf-8'))
+        digest.update(f"vectors:{self.vectors.metric}:{self.vectors.vectors.shape};".encode('utf-8'))
+        digest.update(self.vectors.vectors.tobytes())
+        for row, node_id in sorted(self.row_to_node.items()):
+            digest.update(f"{row}:{node_id};".encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def close(self) -> None:
+        """Release the docstore's file handles and memory maps, if it holds any."""
+        close = getattr(self.docstore, 'close', None)
+        if close is not None:
+            close()
+
+    def is_stale(self) -> bool:
+        return store_signature(self.persist_dir) != self.signature
+
+    def node(self, node_id: str) -> Optional[RetrievedNode]:
+        data = self.docstore.get(node_id)
+        if data is None:
+            return None
+        return RetrievedNode(node_id, data.get('text', ''), None, data.get('metadata', {}))
+
+    def filtered_node_ids(self, filters: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+        """
+        Nodes matching every metadata filter; None means all. Keys the lexical
+        index covers resolve from its postings, any other key is checked
+        against each remaining candidate's docstore metadata.
+        """
+        if not filters:
+            return None
+        indexed = {key: value for key, value in filters.items() if key in self.lexical.metadata_fields}
+        scanned = {key: value for key, value in filters.items() if key not in indexed}
+        node_ids = self.lexical.filter(indexed) if indexed else self.node_to_row
+        candidates = [node_id for node_id in node_ids if node_id in self.node_to_row]
+        if not scanned:
+            return candidates
+        return [
+            node_id for node_id in candidates
+            if all(_matches((self.docstore.get(node_id) or {}).get('metadata', {}).get(key), value)
+                   for key, value in scanned.items())
+        ]
+
+    def rows_for(self, node_ids: List[str]) -> List[int]:
+        return [self.node_to_row[node_id] for node_id in node_ids if node_id in self.node_to_row]
+
+
+def _matches(actual: Any, expected: Any) -> bool:
+    """Same normalization as the lexical index postings."""
+    if actual is None:
+        return False
+    values = expected if isinstance(expected, (list, tuple, set)) else [expected]
+    return field_value(actual) in {field_value(value) for value in values}
+
+
+class PlayerFinderRetriever:
+    """
+    Top-k node retrieval with query-embedding and result caching.
+
+    Every call polls the store files; if they changed the index is reloaded
+    and, when its version (documents, vectors or row mapping) differs,
+    cached results are invalidated.
+    """
+
+    def __init__(self, embed: Callable[[str], np.ndarray], persist_dir: str = DEFAULT_PERSIST_DIR,
+                 cache: Optional[QueryCache] = None, lexical_k: int = 50,
+                 vector_k: int = 50, min_lexical_candidates: Optional[int] = None):
+        self.embed = embed
+        self.lexical_k = lexical_k
+        self.vector_k = vector_k
+        self.min_lexical_candidates = min_lexical_candidates
+        self.persist_dir = persist_dir
+        self.cache = cache if cache is not None else QueryCache()
+        self.index = PersistedIndex.load(persist_dir)
+        self.cache.sync_index_version(self.index.version)
+
+    def refresh(self) -> bool:
+        """Reload the index if its files changed. Returns True if reloaded."""
+        if not self.index.is_stale():
+            return False
+        logger.info(f"Store files in {self.persist_dir} changed, reloading index")
+        # Unmap the old layout first: reloading may rebuild it in place, and
+        # Windows cannot replace a file that is still memory-mapped
+        self.index.close()
+        self.index = PersistedIndex.load(self.persist_dir)
+        self.cache.sync_index_version(self.index.version)
+        return True
+
+    def _vector_hits(self, query: str, k: int, node_ids: Optional[List[str]]) -> List[Tuple[str, float]]:
+        embedding = self.cache.embedding(query, self.embed)
+        rows = self.index.rows_for(node_ids) if node_ids is not None else None
+        return [
+            (self.index.row_to_node[row], dist)
+            for row, dist in self.index.vectors.search(embedding, k, rows)
+            if row in self.index.row_to_node
+        ]
+
+    def _search(self, query: str, k: int, filters: Optional[Dict[str, Any]],
+                mode: str) -> List[RetrievedNode]:
+        candidates = self.index.filtered_node_ids(filters)
+        lexical_hits: List[Tuple[str, float]] = []
+        vector_candidates = candidates
+
+        if mode in ('hybrid', 'lexical'):
+            lexical_hits = self.index.lexical.search(query, max(k, self.lexical_k), candidates)
+            min_candidates = self.min_lexical_candidates or k
+            if mode == 'hybrid' and len(lexical_hits) >= min_candidates:
+                vector_candidates = [node_id for node_id, _ in lexical_hits]
+
+        vector_hits = [] if mode == 'lexical' else self._vector_hits(
+            query, max(k, self.vector_k), vector_candidates)
+
+        if mode == 'vector':
+            ranked = [(node_id, -dist) for node_id, dist in vector_hits]
+        elif mode == 'lexical':
+            ranked = lexical_hits
+        else:
+            ranked = reciprocal_rank_fusion([
+                [node_id for node_id, _ in lexical_hits],
+                [node_id for node_id, _ in vector_hits]
+            ])
+
+        distances = dict(vector_hits)
+        lexical_scores = dict(lexical_hits)
+        results = []
+        for node_id, score in ranked[:k]:
+            node = self.index.node(node_id)
+            if node is None:
+                continue
+            node.distance = distances.get(node_id)
+            node.lexical_score = lexical_scores.get(node_id)
+            node.score = score
+            results.append(node)
+        return results
+
+    def retrieve(self, query: str, k: int = 5, filters: Optional[Dict[str, Any]] = None,
+                 mode: str = 'hybrid') -> List[RetrievedNode]:
+        """
+        Top-k nodes for `query`. `mode` is 'hybrid' (BM25 pre-filter + vector
+        re-rank, fused), 'vector' or 'lexical'. `filters` map metadata fields
+        to a value or list of accepted values.
+        """
+        if mode not in ('hybrid', 'vector', 'lexical'):
+            raise ValueError(f"Unknown retrieval mode: {mode}")
+        self.refresh()
+        key = self.cache.result_key(query, filters, k) + (mode,)
+        cached = self.cache.results.get_or_compute(key, lambda: self._search(query, k, filters, mode))
+        # Copies, so callers editing a result do not change what later queries get
+        return [replace(node, metadata=dict(node.metadata)) for node in cached]
+
+    def close(self) -> None:
+        self.index.close()
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        return self.cache.stats()
@@ -0,0 +1,91 @@
+"""
+Vector index persisted by the Player Finder (ChatRTX / LlamaIndex) build.
+
+`default__vector_store.json` is not JSON: it is a serialized FAISS
+IndexFlatL2. The flat layout is simple enough to read with NumPy, so search
+does not need faiss installed.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import json
+import logging
+import struct
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTOR_STORE_FILE = 'default__vector_store.json'
+INDEX_STORE_FILE = 'index_store.json'
+
+# fourcc, d (int32), ntotal (int64), two unused int64s, is_trained (uint8), metric (int32)
+_FAISS_HEADER = struct.Struct('<4siqqqBi')
+_FAISS_FLAT_FOURCCS = {b'IxF2': 'l2', b'IxFI': 'ip'}
+
+
+class FlatVectorStore:
+    """Exhaustive float32 vector index matching faiss IndexFlatL2 / IndexFlatIP."""
+
+    def __init__(self, vectors: np.ndarray, metric: str = 'l2'):
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.metric = metric
+        self._sq_norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+
+    @classmethod
+    def load(cls, persist_dir: str) -> 'FlatVectorStore':
+        path = Path(persist_dir) / VECTOR_STORE_FILE
+        raw = path.read_bytes()
+        fourcc, dim, ntotal, _, _, _, _ = _FAISS_HEADER.unpack_from(raw, 0)
+        if fourcc not in _FAISS_FLAT_FOURCCS:
+            raise ValueError(f"{path} is not a flat faiss index (found {fourcc!r})")
+        offset = _FAISS_HEADER.size
+        (size,) = struct.unpack_from('<q', raw, offset)
+        if size != dim * ntotal:
+            raise ValueError(f"{path}: expected {dim * ntotal} floats, found {size}")
+        vectors = np.frombuffer(raw, dtype='<f4', count=size, offset=offset + 8).reshape(ntotal, dim)
+        logger.info(f"Loaded {ntotal} x {dim} vectors from {path}")
+        return cls(vectors, _FAISS_FLAT_FOURCCS[fourcc])
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def search(self, query: np.ndarray, k: int,
+               candidates: Optional[Sequence[int]] = None) -> List[Tuple[int, float]]:
+        """
+        Top-k (row, distance) pairs; smaller is closer for both metrics
+        (inner product is returned negated). `candidates` restricts scoring
+        to those rows.
+        """
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        rows = np.arange(len(self.vectors)) if candidates is None else np.asarray(candidates, dtype=np.int64)
+        if rows.size == 0:
+            return []
+        dots = self.vectors[rows] @ query
+        if self.metric == 'ip':
+            dists = -dots
+        else:
+            dists = self._sq_norms[rows] - 2 * dots + float(query @ query)
+        k = min(k, rows.size)
+        top = np.argpartition(dists, k - 1)[:k]
+        top = top[np.argsort(dists[top])]
+        return [(int(rows[i]), float(dists[i])) for i in top]
+
+
+def load_row_to_node(persist_dir: str) -> Dict[int, str]:
+    """Vector row -> node id mapping from index_store.json (`nodes_dict`)."""
+    path = Path(persist_dir) / INDEX_STORE_FILE
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    mapping: Dict[int, str] = {}
+    for entry in data.get('index_store/data', {}).values():
+        payload = entry.get('__data__')
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        for row, node_id in payload.get('nodes_dict', {}).items():
+            mapping[int(row)] = node_id
+    return mapping
@@ -5,10 +5,12 @@ from src.scrapers.player_scraper import (
     Player,
     Contract
 )
+from src.scrapers.http_driver import HttpDriver
 
 __all__ = [
     'PlayerScraper',
     'Player',
     'Contract',
+    'HttpDriver',
     'scrape_page'
 ]
\ No newline at end of file
@@ -0,0 +1,56 @@
+from typing import List, Optional
+import html
+import logging
+import re
+import urllib.error
+import urllib.request
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+_LINK_RE = re.compile(r'<a\b[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+class HttpDriver:
+    """
+    Plain-HTTP fetch backend exposing the subset of the Selenium WebDriver
+    interface used by scrape_league (get, page_source, find_elements by link
+    text, execute_script, delete_all_cookies, quit). No JavaScript runs, so it
+    only suits servers that render the players table server-side, such as the
+    local sofifa stand-in.
+    """
+    def __init__(self, timeout: float = 30, user_agent: str = 'fifa-scraper/1.0'):
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.page_source: str = ''
+        self.last_status: Optional[int] = None
+
+    def get(self, url: str) -> None:
+        request = urllib.request.Request(url, headers={'User-Agent': self.user_agent})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                self.last_status = response.status
+                self.page_source = response.read().decode('utf-8', errors='replace')
+        except urllib.error.HTTPError as e:
+            # Browsers render error pages too; keep the body and let the parser find nothing
+            logger.warning(f"HTTP {e.code} fetching {url}")
+            self.last_status = e.code
+            self.page_source = e.read().decode('utf-8', errors='replace')
+
+    def find_elements(self, by: str, value: str) -> List:
+        if by != By.LINK_TEXT:
+            raise NotImplementedError(f"HttpDriver only supports {By.LINK_TEXT!r} lookups")
+        # A regex scan avoids building a second parse tree per page
+        return [
+            match.group(0) for match in _LINK_RE.finditer(self.page_source)
+            if html.unescape(_TAG_RE.sub('', match.group(1))).strip() == value
+        ]
+
+    def execute_script(self, script: str, *args) -> None:
+        return None
+
+    def delete_all_cookies(self) -> None:
+        return None
+
+    def quit(self) -> None:
+        self.page_source = ''
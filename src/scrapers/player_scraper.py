@@ -102,6 +102,10 @@ class PlayerScraper:
     @limits(calls=30, period=60)  # 30 calls per minute
     def scrape_page(self) -> List[Dict]:
         """Scrape all player data from the page."""
+        return self.parse_page()
+
+    def parse_page(self) -> List[Dict]:
+        """Parse all player rows on the page without rate limiting."""
         try:
             table_rows: ResultSet = self.soup.find_all('tr')
             logger.info(f"Found {len(table_rows)} rows to process")
@@ -140,4 +144,9 @@ class PlayerScraper:
 def scrape_page(soup: BeautifulSoup, lg: int) -> List[Dict]:
     """Main function to scrape a page of player data."""
     scraper = PlayerScraper(soup, lg)
-    return scraper.scrape_page()
\ No newline at end of file
+    return scraper.scrape_page()
+
+def parse_page(soup: BeautifulSoup, lg: int) -> List[Dict]:
+    """Parse a page of player data, bypassing the request rate limit."""
+    scraper = PlayerScraper(soup, lg)
+    return scraper.parse_page()
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""Search modules for finding players in the scraped data."""
+
+from src.search.player_similarity import (
+    SimilarityIndex,
+    build_similarity_indexes
+)
+
+__all__ = [
+    'SimilarityIndex',
+    'build_similarity_indexes'
+]
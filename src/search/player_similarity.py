@@ -0,0 +1,189 @@
+"""
+"Players statistically like X" search over the scraped skill columns.
+
+Each roster version gets one SimilarityIndex. Players are split into position
+groups (GK / DEF / MID / FWD by Best Position); within a group the skill
+columns are z-scored and held as one contiguous float32 matrix. Queries are
+exact k-NN with batched NumPy (squared L2 via a single matrix-vector product
+plus argpartition), with age / value / league filters applied as masks
+before the top-k selection.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.utils.deltas import load_roster_versions
+from src.utils.validation import (
+    FACE_STAT_COLUMNS,
+    SKILL_COLUMNS,
+    parse_currency_column,
+    parse_rating_column
+)
+
+logger = logging.getLogger(__name__)
+
+FEATURE_COLUMNS = SKILL_COLUMNS + FACE_STAT_COLUMNS
+
+POSITION_GROUPS = {
+    'GK': 'GK',
+    'CB': 'DEF', 'LB': 'DEF', 'RB': 'DEF', 'LWB': 'DEF', 'RWB': 'DEF',
+    'CDM': 'MID', 'CM': 'MID', 'CAM': 'MID', 'LM': 'MID', 'RM': 'MID',
+    'ST': 'FWD', 'CF': 'FWD', 'LW': 'FWD', 'RW': 'FWD'
+}
+
+RESULT_COLUMNS = ['Player ID', 'Player', 'Best Position', 'League', 'Age', 'Value']
+
+
+def position_group(position: str) -> str:
+    return POSITION_GROUPS.get(str(position).strip().upper(), 'OTHER')
+
+
+@dataclass
+class _GroupMatrix:
+    """Normalized features for one position group."""
+    features: np.ndarray      # (n, d) float32, C-contiguous
+    sq_norms: np.ndarray      # (n,) float32
+    rows: np.ndarray          # positions into SimilarityIndex.players
+    mean: np.ndarray
+    std: np.ndarray
+
+
+class SimilarityIndex:
+    """Exact nearest-neighbour index over one roster version."""
+
+    def __init__(self, players: pd.DataFrame, groups: Dict[str, _GroupMatrix]):
+        self.players = players
+        self.groups = groups
+        # Metadata columns as flat arrays so filters are vector ops
+        self._ages = players['Age'].to_numpy(dtype=np.float32)
+        self._values = players['Value'].to_numpy(dtype=np.float64)
+        self._leagues = players['League'].astype(str).to_numpy()
+        self._group_of = players['Position Group'].to_numpy()
+        self._row_of_id = pd.Series(np.arange(len(players)), index=players['Player ID'])
+        self._group_pos = np.empty(len(players), dtype=np.int64)
+        for matrix in groups.values():
+            self._group_pos[matrix.rows] = np.arange(len(matrix.rows))
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'SimilarityIndex':
+        players = pd.DataFrame({
+            'Player ID': pd.to_numeric(df['Player ID'], errors='coerce'),
+            'Player': df.get('Player'),
+            'Best Position': df.get('Best Position'),
+            'League': df.get('League'),
+            'Age': pd.to_numeric(df.get('Age'), errors='coerce'),
+            'Value': parse_currency_column(df['Value']) if 'Value' in df.columns else np.nan
+        })
+        players['Position Group'] = players['Best Position'].map(position_group)
+
+        features = pd.DataFrame({
+            col: parse_rating_column(df[col]) if col in df.columns else np.nan
+            for col in FEATURE_COLUMNS
+        })
+        # One row per player; the last copy is the newest when tables are concatenated oldest first
+        valid = (players['Player ID'].notna()
+                 & ~players['Player ID'].duplicated(keep='last')).to_numpy()
+        players = players[valid].reset_index(drop=True)
+        features = features[valid].reset_index(drop=True)
+        players['Player ID'] = players['Player ID'].astype('int64')
+
+        groups = {}
+        for group, rows in players.groupby('Position Group').indices.items():
+            block = features.iloc[rows].to_numpy(dtype=np.float32)
+            mean = np.nanmean(block, axis=0)
+            mean = np.where(np.isnan(mean), 0, mean).astype(np.float32)
+            std = np.nanstd(block, axis=0)
+            std = np.where(np.isnan(std) | (std == 0), 1, std).astype(np.float32)
+            # Missing skills fall back to the group mean, i.e. zero after scaling
+            block = np.where(np.isnan(block), mean, block)
+            block = np.ascontiguousarray((block - mean) / std, dtype=np.float32)
+            groups[group] = _GroupMatrix(
+                features=block,
+                sq_norms=np.einsum('ij,ij->i', block, block),
+                rows=np.asarray(rows, dtype=np.int64),
+                mean=mean,
+                std=std
+            )
+
+        logger.info(f"Built similarity index for {len(players)} players in {len(groups)} position groups")
+        return cls(players, groups)
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def _filter_mask(self, rows: np.ndarray, min_age: Optional[float], max_age: Optional[float],
+                     max_value: Optional[float], leagues: Optional[Iterable[str]]) -> np.ndarray:
+        mask = np.ones(len(rows), dtype=bool)
+        if min_age is not None:
+            mask &= self._ages[rows] >= min_age
+        if max_age is not None:
+            mask &= self._ages[rows] <= max_age
+        if max_value is not None:
+            mask &= self._values[rows] <= max_value
+        if leagues is not None:
+            mask &= np.isin(self._leagues[rows], list(leagues))
+        return mask
+
+    def _top_k(self, matrix: _GroupMatrix, queries: np.ndarray, k: int,
+               mask: np.ndarray) -> List[List[tuple]]:
+        """Batched squared-L2 top-k; returns (row, distance) pairs per query."""
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return [[] for _ in range(len(queries))]
+        feats = matrix.features[candidates]
+        dists = matrix.sq_norms[candidates][None, :] - 2 * queries @ feats.T
+        dists += np.einsum('ij,ij->i', queries, queries)[:, None]
+        k = min(k, candidates.size)
+        top = np.argpartition(dists, k - 1, axis=1)[:, :k]
+        results = []
+        for q, idx in enumerate(top):
+            order = idx[np.argsort(dists[q, idx])]
+            dist = np.sqrt(np.maximum(dists[q, order], 0))
+            results.append(list(zip(matrix.rows[candidates[order]], dist)))
+        return results
+
+    def _to_frame(self, hits: List[tuple]) -> pd.DataFrame:
+        rows = [row for row, _ in hits]
+        frame = self.players.iloc[rows][RESULT_COLUMNS].reset_index(drop=True)
+        frame['Distance'] = [float(d) for _, d in hits]
+        return frame
+
+    def similar_to(self, player_ids, k: int = 10, min_age: Optional[float] = None,
+                   max_age: Optional[float] = None, max_value: Optional[float] = None,
+                   leagues: Optional[Iterable[str]] = None) -> Dict[int, pd.DataFrame]:
+        """
+        Top-k players most like each of `player_ids`, searched within the
+        query player's position group. Players are batched per group so each
+        group costs one matrix product.
+        """
+        if np.isscalar(player_ids):
+            player_ids = [player_ids]
+        by_group: Dict[str, List[int]] = {}
+        for pid in player_ids:
+            if pid not in self._row_of_id.index:
+                logger.warning(f"Player ID {pid} not in similarity index")
+                continue
+            by_group.setdefault(self._group_of[self._row_of_id[pid]], []).append(pid)
+
+        results = {}
+        for group, pids in by_group.items():
+            matrix = self.groups[group]
+            mask = self._filter_mask(matrix.rows, min_age, max_age, max_value, leagues)
+            query_rows = np.array([self._row_of_id[pid] for pid in pids])
+            queries = matrix.features[self._group_pos[query_rows]]
+            # Ask for one extra so the query player itself can be dropped
+            for pid, hits in zip(pids, self._top_k(matrix, queries, k + 1, mask)):
+                hits = [hit for hit in hits if hit[0] != self._row_of_id[pid]][:k]
+                results[pid] = self._to_frame(hits)
+        return results
+
+
+def build_similarity_indexes(input_dir: str = 'data',
+                             default_year: Optional[int] = None) -> Dict[int, SimilarityIndex]:
+    """One SimilarityIndex per roster version found in `input_dir`."""
+    rosters = load_roster_versions(input_dir, default_year=default_year)
+    return {year: SimilarityIndex.from_dataframe(df) for year, df in sorted(rosters.items())}
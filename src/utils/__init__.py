@@ -9,11 +9,29 @@ from src.utils.data_cleaning import (
     DataValidator,
     clean_stats
 )
+from src.utils.validation import (
+    ValidationRule,
+    BatchValidator,
+    QualityReport,
+    validate_dataframe
+)
+from src.utils.deltas import (
+    DeltaStore,
+    compute_deltas,
+    update_delta_tables
+)
 
 __all__ = [
     'ValueCleaner',
     'DateCleaner',
     'AttributeCleaner',
     'DataValidator',
-    'clean_stats'
+    'clean_stats',
+    'ValidationRule',
+    'BatchValidator',
+    'QualityReport',
+    'validate_dataframe',
+    'DeltaStore',
+    'compute_deltas',
+    'update_delta_tables'
 ]
\ No newline at end of file
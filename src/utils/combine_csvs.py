@@ -1,8 +1,13 @@
 # src/utils/combine_csvs.py
-import pandas as pd
+import sys
 from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import pandas as pd
 import logging
 from datetime import datetime
+from src.utils.deltas import roster_year
+from src.utils.validation import validate_dataframe
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +50,9 @@ def combine_csv_files(input_dir: str = 'data', output_name: str = None) -> None:
                 df = pd.read_csv(file)
                 # Add source file name as a column
                 df['Source_File'] = file.stem
+                # Roster year from the file name, so validation can report per year
+                if 'Year' not in df.columns:
+                    df['Year'] = roster_year(df, file)
                 dfs.append(df)
             except Exception as e:
                 logger.error(f"Error reading {file.name}: {e}")
@@ -71,6 +79,9 @@ def combine_csv_files(input_dir: str = 'data', output_name: str = None) -> None:
             logger.info(f"Total rows: {len(combined_df)}")
             logger.info(f"Columns: {', '.join(combined_df.columns)}")
             
+            # Aggregated quality report instead of per-value warnings
+            validate_dataframe(combined_df).log(logger)
+            
             # Remove duplicates if any
             original_length = len(combined_df)
             combined_df = combined_df.drop_duplicates()
@@ -0,0 +1,270 @@
+"""
+Cross-season attribute delta tables.
+
+After each ingest, every roster version (FIFA year) is reduced to a compact
+snapshot of the tracked attributes keyed by Player ID. Deltas between
+consecutive versions are computed with a sorted join on Player ID and stored
+per version pair, indexed by league so "top risers in league X" is a lookup.
+Adding a new season only computes the pairs that touch it.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import json
+import logging
+import re
+
+import pandas as pd
+
+from src.utils.validation import FACE_STAT_COLUMNS, parse_currency_column, parse_rating_column
+
+logger = logging.getLogger(__name__)
+
+RATING_DELTA_COLUMNS = ['Overall Score', 'Potential Score'] + FACE_STAT_COLUMNS
+CURRENCY_DELTA_COLUMNS = ['Value', 'Wage']
+DELTA_COLUMNS = RATING_DELTA_COLUMNS + CURRENCY_DELTA_COLUMNS
+
+ID_COLUMN = 'Player ID'
+INFO_COLUMNS = ['Player', 'League', 'Best Position']
+
+# save_data() names files fifa_players_{league}__{year}_{timestamp}.csv
+_FILE_YEAR_RE = re.compile(r'_(\d{4})_\d{8}_\d{6}$')
+_FILE_NAME_RE = re.compile(r'^fifa_players_(.*?)_+(?:\d{4}_)?(\d{8}_\d{6})$')
+
+
+def delta_column(column: str) -> str:
+    return f"{column} Delta"
+
+
+def roster_year(df: pd.DataFrame, file: Optional[Path] = None) -> Optional[int]:
+    """Determine the roster version of a table from its Year column or file name."""
+    if 'Year' in df.columns and df['Year'].notna().any():
+        return int(df['Year'].dropna().iloc[0])
+    if file is not None:
+        match = _FILE_YEAR_RE.search(file.stem)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def file_league_and_timestamp(df: pd.DataFrame, file: Path) -> Tuple[str, str]:
+    """
+    League and scrape timestamp of a per-league CSV. The League column is
+    preferred since it carries the country ("Premier League (England)").
+    """
+    match = _FILE_NAME_RE.match(file.stem)
+    league, timestamp = match.groups() if match else (file.stem, '')
+    if 'League' in df.columns and df['League'].notna().any():
+        league = str(df['League'].dropna().iloc[0])
+    return league, timestamp
+
+
+def build_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce a roster table to numeric tracked attributes, indexed and sorted by Player ID.
+    Players listed more than once keep their last row, which is the newest
+    scrape when tables are concatenated oldest first.
+    """
+    snapshot = pd.DataFrame(index=df.index)
+    snapshot[ID_COLUMN] = pd.to_numeric(df[ID_COLUMN], errors='coerce')
+    for col in INFO_COLUMNS:
+        snapshot[col] = df[col] if col in df.columns else None
+    for col in RATING_DELTA_COLUMNS:
+        snapshot[col] = parse_rating_column(df[col]) if col in df.columns else float('nan')
+    for col in CURRENCY_DELTA_COLUMNS:
+        snapshot[col] = parse_currency_column(df[col]) if col in df.columns else float('nan')
+
+    snapshot = snapshot.dropna(subset=[ID_COLUMN])
+    snapshot[ID_COLUMN] = snapshot[ID_COLUMN].astype('int64')
+    snapshot = snapshot.drop_duplicates(subset=ID_COLUMN, keep='last')
+    return snapshot.set_index(ID_COLUMN).sort_index()
+
+
+def compute_deltas(previous: pd.DataFrame, current: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-player change between two snapshots from build_snapshot().
+
+    Both inputs are sorted on Player ID, so the inner join is a merge of two
+    sorted indexes. Player info (name, league, position) comes from `current`.
+    """
+    prev_values = previous[DELTA_COLUMNS]
+    curr_values = current[DELTA_COLUMNS]
+    joined = curr_values.join(prev_values, how='inner', lsuffix='', rsuffix=' Previous', sort=False)
+
+    deltas = current.loc[joined.index, INFO_COLUMNS].copy()
+    for col in DELTA_COLUMNS:
+        deltas[col] = joined[col]
+        deltas[delta_column(col)] = joined[col] - joined[f"{col} Previous"]
+    return deltas
+
+
+class DeltaStore:
+    """
+    On-disk store of roster snapshots and consecutive-version delta tables.
+
+    Layout under `store_dir`:
+        manifest.json            known versions and stored pairs
+        snapshot_{year}.csv      tracked attributes for one roster version
+        deltas_{from}_{to}.csv   per-player deltas, sorted by League
+    """
+
+    def __init__(self, store_dir: str = 'data/deltas'):
+        self.store_dir = Path(store_dir)
+        self._tables: Dict[Tuple[int, int], pd.DataFrame] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.store_dir / 'manifest.json'
+
+    def _read_manifest(self) -> Dict:
+        if self.manifest_path.exists():
+            with open(self.manifest_path, encoding='utf-8') as f:
+                return json.load(f)
+        return {'versions': [], 'pairs': []}
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+    def _snapshot_path(self, year: int) -> Path:
+        return self.store_dir / f'snapshot_{year}.csv'
+
+    def _deltas_path(self, pair: Tuple[int, int]) -> Path:
+        return self.store_dir / f'deltas_{pair[0]}_{pair[1]}.csv'
+
+    def versions(self) -> List[int]:
+        return sorted(self._read_manifest()['versions'])
+
+    def pairs(self) -> List[Tuple[int, int]]:
+        return [tuple(pair) for pair in self._read_manifest()['pairs']]
+
+    def _load_snapshot(self, year: int) -> pd.DataFrame:
+        return pd.read_csv(self._snapshot_path(year), index_col=ID_COLUMN)
+
+    def add_version(self, year: int, df: pd.DataFrame) -> List[Tuple[int, int]]:
+        """
+        Store (or replace) one roster version and recompute only the delta
+        pairs it participates in. Returns the pairs that were (re)written.
+        """
+        return self.add_versions({year: df})
+
+    def add_versions(self, rosters: Dict[int, pd.DataFrame]) -> List[Tuple[int, int]]:
+        """
+        Store (or replace) several roster versions, then recompute each
+        affected delta pair once. Returns the pairs that were (re)written.
+        """
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._read_manifest()
+
+        snapshots = {}
+        for year, df in rosters.items():
+            snapshots[year] = build_snapshot(df)
+            snapshots[year].to_csv(self._snapshot_path(year))
+        versions = sorted(set(manifest['versions']) | set(snapshots))
+
+        wanted = list(zip(versions, versions[1:]))
+        stale = [tuple(p) for p in manifest['pairs'] if tuple(p) not in wanted]
+        for pair in stale:
+            self._deltas_path(pair).unlink(missing_ok=True)
+            self._tables.pop(pair, None)
+
+        existing = {tuple(p) for p in manifest['pairs']} - set(stale)
+        written = []
+        for pair in wanted:
+            if pair in existing and not snapshots.keys() & set(pair):
+                continue
+            for year in pair:
+                if year not in snapshots:
+                    snapshots[year] = self._load_snapshot(year)
+            previous, current = snapshots[pair[0]], snapshots[pair[1]]
+            deltas = compute_deltas(previous, current)
+            deltas = deltas.sort_values(['League', delta_column('Overall Score')],
+                                        ascending=[True, False])
+            deltas.to_csv(self._deltas_path(pair))
+            self._tables.pop(pair, None)
+            written.append(pair)
+            logger.info(f"Stored {len(deltas)} player deltas for {pair[0]} -> {pair[1]}")
+
+        manifest['versions'] = versions
+        manifest['pairs'] = [list(p) for p in wanted]
+        self._write_manifest(manifest)
+        return written
+
+    def load(self, pair: Optional[Tuple[int, int]] = None) -> pd.DataFrame:
+        """Delta table for a version pair (latest by default), indexed by League."""
+        pairs = self.pairs()
+        if not pairs:
+            raise FileNotFoundError(f"No delta tables stored in {self.store_dir}")
+        pair = tuple(pair) if pair is not None else pairs[-1]
+        if pair not in self._tables:
+            table = pd.read_csv(self._deltas_path(pair))
+            self._tables[pair] = table.set_index('League', drop=False).sort_index()
+        return self._tables[pair]
+
+    def top_risers(self, league: str, column: str = 'Overall Score', n: int = 10,
+                   pair: Optional[Tuple[int, int]] = None) -> pd.DataFrame:
+        """Players in `league` with the largest increase in `column`."""
+        table = self.load(pair)
+        if league not in table.index:
+            return table.iloc[0:0]
+        rows = table.loc[[league]]
+        return rows.nlargest(n, delta_column(column)).reset_index(drop=True)
+
+
+def load_roster_versions(input_dir: str = 'data',
+                         default_year: Optional[int] = None) -> Dict[int, pd.DataFrame]:
+    """
+    Group the per-league CSV files in `input_dir` by roster version. Files
+    whose version cannot be determined are assigned `default_year`, or
+    skipped if it is None. When a league was scraped more than once for a
+    version, only the newest file (by scrape timestamp) is used.
+    """
+    latest: Dict[Tuple[int, str], Tuple[str, pd.DataFrame]] = {}
+    for file in Path(input_dir).glob('fifa_players_*.csv'):
+        try:
+            df = pd.read_csv(file)
+        except Exception as e:
+            logger.error(f"Error reading {file.name}: {e}")
+            continue
+        year = roster_year(df, file)
+        if year is None:
+            year = default_year
+        if year is None:
+            logger.warning(f"Could not determine roster version for {file.name}, skipping")
+            continue
+        league, timestamp = file_league_and_timestamp(df, file)
+        previous = latest.get((year, league))
+        if previous is not None:
+            older = min(previous[0], timestamp)
+            logger.info(f"Ignoring older {league} scrape for {year} ({older})")
+            if timestamp < previous[0]:
+                continue
+        latest[(year, league)] = (timestamp, df)
+
+    tables: Dict[int, List[Tuple[str, pd.DataFrame]]] = {}
+    for (year, _), entry in latest.items():
+        tables.setdefault(year, []).append(entry)
+    # Oldest first, so build_snapshot keeps the newest row for a player who moved leagues
+    return {
+        year: pd.concat([df for _, df in sorted(entries, key=lambda e: e[0])], ignore_index=True)
+        for year, entries in tables.items()
+    }
+
+
+def update_delta_tables(input_dir: str = 'data', store_dir: str = 'data/deltas',
+                        years: Optional[List[int]] = None) -> List[Tuple[int, int]]:
+    """
+    Pipeline stage run after an ingest. Only versions in `years` (default:
+    versions not yet in the store) are added, so a new season costs one
+    snapshot plus at most two delta tables. All snapshots are written before
+    the pairs are rebuilt, so each affected pair is computed once.
+    """
+    store = DeltaStore(store_dir)
+    rosters = load_roster_versions(input_dir)
+    known = set(store.versions())
+    pending = years if years is not None else [y for y in rosters if y not in known]
+
+    for year in sorted(pending):
+        if year not in rosters:
+            logger.warning(f"No roster data found for {year}")
+    return store.add_versions({year: rosters[year] for year in pending if year in rosters})
@@ -0,0 +1,288 @@
+"""
+Column-wise validation of scraped player tables.
+
+DataValidator checks one value at a time and logs every failure, which floods
+the log on multi-season tables. The rules here are declared once and evaluated
+over whole columns with pandas, producing a single QualityReport with
+violation counts per rule, per league and per year, plus a sample of the
+offending Player IDs.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MISSING_TOKENS = ['', 'N/A', 'nan', 'None']
+
+SKILL_COLUMNS = [
+    'Crossing', 'Finishing', 'Heading Accuracy', 'Short Passing', 'Volleys',
+    'Dribbling', 'Curve', 'FK Accuracy', 'Long Passing', 'Ball Control',
+    'Acceleration', 'Sprint Speed', 'Agility', 'Reactions', 'Balance',
+    'Shot Power', 'Jumping', 'Stamina', 'Strength', 'Long Shots',
+    'Aggression', 'Interceptions', 'Attack Position', 'Vision', 'Penalties',
+    'Composure', 'Defensive Awareness', 'Standing Tackle', 'Sliding tackle',
+    'GK Diving', 'GK Handling', 'GK Kicking', 'GK Positioning', 'GK Reflexes'
+]
+FACE_STAT_COLUMNS = [
+    'Pace/Diving', 'Shooting/Handling', 'Passing/Kicking',
+    'Dribbling/Reflexes', 'Defending/Pace', 'Physical/Positioning'
+]
+RATING_COLUMNS = ['Overall Score', 'Potential Score', 'Best Overall'] + SKILL_COLUMNS + FACE_STAT_COLUMNS
+
+CURRENCY_PATTERN = r'^€?\s*\d[\d,]*(\.\d+)?\s*[MK]?$'
+
+
+def is_missing(values: pd.Series) -> pd.Series:
+    """Boolean mask of empty / 'N/A' cells."""
+    return values.isna() | values.astype(str).str.strip().isin(MISSING_TOKENS)
+
+
+def parse_numeric_column(values: pd.Series) -> pd.Series:
+    """Coerce a column to numbers, leaving unparsable cells as NaN."""
+    return pd.to_numeric(values, errors='coerce')
+
+
+def parse_rating_column(values: pd.Series) -> pd.Series:
+    """Parse ratings, taking the base value of boosted cells such as "79+3"."""
+    numeric = pd.to_numeric(values, errors='coerce')
+    boosted = numeric.isna()
+    if boosted.any():
+        base = values[boosted].astype(str).str.strip().str.extract(r'^(\d+)[+-]\d+$', expand=False)
+        numeric[boosted] = pd.to_numeric(base, errors='coerce')
+    return numeric
+
+
+def parse_currency_column(values: pd.Series) -> pd.Series:
+    """
+    Vectorized counterpart of ValueCleaner.convert_currency.
+    Examples:
+        "€5M" -> 5000000.0
+        "€500K" -> 500000.0
+        "€1,500" -> 1500.0
+    """
+    text = (values.astype(str)
+            .str.replace('€', '', regex=False)
+            .str.replace(' ', '', regex=False)
+            .str.replace(',', '', regex=False))
+    multiplier = pd.Series(1.0, index=values.index)
+    multiplier[text.str.endswith('M')] = 1_000_000
+    multiplier[text.str.endswith('K')] = 1_000
+    return pd.to_numeric(text.str.rstrip('MK'), errors='coerce') * multiplier
+
+
+def parse_year_column(values: pd.Series) -> pd.Series:
+    """Extract the four-digit year from contract cells such as "2025" or "Jun 30, 2025"."""
+    years = values.astype(str).str.extract(r'(\d{4})', expand=False)
+    return pd.to_numeric(years, errors='coerce')
+
+
+@dataclass
+class ValidationRule:
+    """
+    A declarative check over one or more columns.
+
+    `check` receives the table restricted to those of `columns` it has and
+    returns a boolean Series that is True for every violating row. Rules
+    that compare columns set `require_all` and are skipped unless every
+    column is present.
+    """
+    name: str
+    columns: Sequence[str]
+    check: Callable[[pd.DataFrame], pd.Series]
+    description: str = ''
+    require_all: bool = False
+
+    def present_columns(self, df: pd.DataFrame) -> List[str]:
+        return [col for col in self.columns if col in df.columns]
+
+    def applies_to(self, df: pd.DataFrame) -> bool:
+        present = self.present_columns(df)
+        return len(present) == len(self.columns) if self.require_all else bool(present)
+
+    def violations(self, df: pd.DataFrame) -> pd.Series:
+        mask = self.check(df[self.present_columns(df)])
+        return mask.fillna(False).astype(bool)
+
+
+def range_rule(name: str, columns: Sequence[str], low: Optional[float] = None,
+               high: Optional[float] = None,
+               parser: Callable[[pd.Series], pd.Series] = parse_numeric_column) -> ValidationRule:
+    """Flag rows where any parsed value lies outside [low, high]. Unparsable cells are ignored."""
+    def check(frame: pd.DataFrame) -> pd.Series:
+        mask = pd.Series(False, index=frame.index)
+        for col in frame.columns:
+            parsed = parser(frame[col])
+            if low is not None:
+                mask |= parsed < low
+            if high is not None:
+                mask |= parsed > high
+        return mask
+
+    bounds = f"{low if low is not None else '-inf'}..{high if high is not None else 'inf'}"
+    return ValidationRule(name, list(columns), check, f"values within {bounds}")
+
+
+def type_rule(name: str, columns: Sequence[str],
+              parser: Callable[[pd.Series], pd.Series] = parse_numeric_column) -> ValidationRule:
+    """Flag rows where a non-missing cell cannot be parsed."""
+    def check(frame: pd.DataFrame) -> pd.Series:
+        mask = pd.Series(False, index=frame.index)
+        for col in frame.columns:
+            mask |= parser(frame[col]).isna() & ~is_missing(frame[col])
+        return mask
+
+    return ValidationRule(name, list(columns), check, "values parse as numbers")
+
+
+def format_rule(name: str, columns: Sequence[str], pattern: str) -> ValidationRule:
+    """Flag rows where a non-missing cell does not match `pattern`."""
+    def check(frame: pd.DataFrame) -> pd.Series:
+        mask = pd.Series(False, index=frame.index)
+        for col in frame.columns:
+            text = frame[col].astype(str).str.strip()
+            mask |= ~text.str.match(pattern) & ~is_missing(frame[col])
+        return mask
+
+    return ValidationRule(name, list(columns), check, f"values match {pattern}")
+
+
+def integer_rule(name: str, columns: Sequence[str]) -> ValidationRule:
+    """
+    Flag rows where a non-missing cell is not a non-negative integer. Checked
+    numerically, so IDs read back as floats ("231866.0") because of missing
+    cells still pass.
+    """
+    def check(frame: pd.DataFrame) -> pd.Series:
+        mask = pd.Series(False, index=frame.index)
+        for col in frame.columns:
+            parsed = parse_numeric_column(frame[col])
+            invalid = parsed.isna() | (parsed % 1 != 0) | (parsed < 0)
+            mask |= invalid & ~is_missing(frame[col])
+        return mask
+
+    return ValidationRule(name, list(columns), check, "values are non-negative integers")
+
+
+def order_rule(name: str, earlier: str, later: str,
+               parser: Callable[[pd.Series], pd.Series] = parse_year_column) -> ValidationRule:
+    """Flag rows where `later` parses to a value before `earlier`."""
+    def check(frame: pd.DataFrame) -> pd.Series:
+        return parser(frame[later]) < parser(frame[earlier])
+
+    return ValidationRule(name, [earlier, later], check, f"{later} >= {earlier}", require_all=True)
+
+
+DEFAULT_RULES: List[ValidationRule] = [
+    range_rule('age_range', ['Age'], 15, 45),
+    type_rule('age_type', ['Age']),
+    range_rule('value_range', ['Value'], 0, 500_000_000, parser=parse_currency_column),
+    format_rule('currency_format', ['Value', 'Wage', 'Release Clause'], CURRENCY_PATTERN),
+    range_rule('rating_range', RATING_COLUMNS, 1, 99, parser=parse_rating_column),
+    type_rule('rating_type', RATING_COLUMNS, parser=parse_rating_column),
+    integer_rule('player_id_format', ['Player ID']),
+    order_rule('contract_order', 'Contract Start', 'Contract End'),
+]
+
+
+@dataclass
+class QualityReport:
+    """Aggregated result of a BatchValidator run."""
+    total_rows: int
+    counts: Dict[str, int] = field(default_factory=dict)
+    by_group: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    samples: Dict[str, List] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def total_violations(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def is_clean(self) -> bool:
+        return self.total_violations == 0
+
+    def to_dict(self) -> Dict:
+        return {
+            'total_rows': self.total_rows,
+            'counts': dict(self.counts),
+            'by_group': {
+                group: {str(k): v for k, v in frame.to_dict(orient='index').items()}
+                for group, frame in self.by_group.items()
+            },
+            'samples': dict(self.samples),
+            'skipped': list(self.skipped)
+        }
+
+    def log(self, log: logging.Logger = logger) -> None:
+        """Emit one line per violated rule rather than one per bad value."""
+        if self.is_clean:
+            log.info(f"Validation passed for {self.total_rows} rows")
+            return
+        log.warning(f"Validation found {self.total_violations} violations in {self.total_rows} rows")
+        for rule, count in self.counts.items():
+            if count:
+                log.warning(f"  {rule}: {count} rows (e.g. Player IDs {self.samples.get(rule, [])})")
+        if self.skipped:
+            log.info(f"Skipped rules with missing columns: {', '.join(self.skipped)}")
+
+
+def _sample_values(values: pd.Series) -> List:
+    """Sample IDs as plain ints when a float column only holds whole numbers."""
+    return [int(v) if isinstance(v, float) and v.is_integer() else v for v in values.tolist()]
+
+
+def _group_keys(values: pd.Series) -> pd.Series:
+    """String group labels; years read back from CSV as floats become "2016", not "2016.0"."""
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        values = values.astype('Int64')
+    return values.astype(object).where(values.notna(), 'unknown').astype(str)
+
+
+class BatchValidator:
+    """Runs a set of ValidationRules over a whole DataFrame at once."""
+
+    def __init__(self, rules: Optional[Sequence[ValidationRule]] = None,
+                 id_column: str = 'Player ID',
+                 group_columns: Sequence[str] = ('League', 'Year'),
+                 sample_size: int = 5):
+        self.rules = list(rules) if rules is not None else list(DEFAULT_RULES)
+        self.id_column = id_column
+        self.group_columns = list(group_columns)
+        self.sample_size = sample_size
+
+    def violation_masks(self, df: pd.DataFrame) -> pd.DataFrame:
+        """One boolean column per applicable rule, True where the row violates it."""
+        masks = {}
+        for rule in self.rules:
+            if rule.applies_to(df):
+                masks[rule.name] = rule.violations(df)
+        return pd.DataFrame(masks, index=df.index)
+
+    def validate(self, df: pd.DataFrame) -> QualityReport:
+        masks = self.violation_masks(df)
+        report = QualityReport(
+            total_rows=len(df),
+            skipped=[rule.name for rule in self.rules if rule.name not in masks.columns]
+        )
+        report.counts = {name: int(count) for name, count in masks.sum().items()}
+
+        for group in self.group_columns:
+            if group in df.columns:
+                report.by_group[group] = masks.groupby(_group_keys(df[group])).sum()
+
+        ids = df[self.id_column] if self.id_column in df.columns else pd.Series(df.index, index=df.index)
+        for name in masks.columns:
+            offending = ids[masks[name]]
+            if not offending.empty:
+                report.samples[name] = _sample_values(offending.head(self.sample_size))
+
+        return report
+
+
+def validate_dataframe(df: pd.DataFrame, rules: Optional[Sequence[ValidationRule]] = None) -> QualityReport:
+    """Main function to validate a table of player data."""
+    return BatchValidator(rules).validate(df)